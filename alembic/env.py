@@ -41,6 +41,12 @@ def do_run_migrations(connection: Connection) -> None:
     with context.begin_transaction():
         context.run_migrations()
 
+    if is_sqlite:
+        # Gather planner statistics (sqlite_stat1) for indexes added by
+        # migrations. PRAGMA optimize wouldn't: it only analyzes tables that
+        # queries on the same connection have touched. Cheap at this DB size.
+        connection.exec_driver_sql("ANALYZE")
+
 
 async def run_async_migrations() -> None:
     configuration = config.get_section(config.config_ini_section, {})
@@ -12,17 +12,16 @@ from src.core.db import engine
 
 async def verify_schema():
     async with engine.connect() as conn:
-        result = await conn.execute(text("PRAGMA table_info(sessions)"))
-        columns = result.fetchall()
-        # columns is list of (cid, name, type, notnull, dflt_value, pk)
-        found = False
-        for col in columns:
-            if col[1] == 'settings_weighted':
-                print(f"✅ Found column: {col[1]} ({col[2]})")
-                found = True
-                break
-
-        if not found:
+        # Table-valued pragma: fetch just the column we care about instead of
+        # the whole table_info listing
+        result = await conn.execute(
+            text("SELECT name, type FROM pragma_table_info('sessions') WHERE name = :name LIMIT 1"),
+            {"name": "settings_weighted"},
+        )
+        col = result.fetchone()
+        if col is not None:
+            print(f"✅ Found column: {col[0]} ({col[1]})")
+        else:
             print("❌ Column 'settings_weighted' NOT found!")
             exit(1)
 
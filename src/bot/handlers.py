@@ -42,9 +42,6 @@ from src.core.models import (
 )
 from src.core.poll_service import PollService
 
-# Named tuple for resolved votes (after category resolution)
-ResolvedVote = namedtuple("ResolvedVote", ["game_id", "user_id"])
-
 logger = logging.getLogger(__name__)
 
 
@@ -770,7 +767,7 @@ async def _close_existing_polls(session, context, chat_id, reason="Poll Closed")
                     reply_markup=None,
                 )
         await _try_unpin_message(context.bot, chat_id, p.message_id)
-        await session.delete(p)
+        await PollService.delete_poll(session, p.poll_id)
 
 
 async def start_night(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -1527,29 +1524,49 @@ async def test_mode(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 ),
             ]
 
-            for game in test_games:
-                existing = await session.get(Game, game.id)
-                if not existing:
-                    session.add(game)
+            # Look up what already exists with one IN query per table, then add the
+            # missing rows in bulk so the flush batches the INSERTs.
+            test_game_ids = [g.id for g in test_games]
+            fake_user_ids = [user_id for user_id, _ in fake_users]
 
-            for user_id, name in fake_users:
-                existing_user = await session.get(User, user_id)
-                if not existing_user:
-                    user = User(telegram_id=user_id, telegram_name=name)
-                    session.add(user)
-                    await session.flush()
+            existing_game_ids = set(
+                (await session.execute(select(Game.id).where(Game.id.in_(test_game_ids))))
+                .scalars()
+                .all()
+            )
+            session.add_all([g for g in test_games if g.id not in existing_game_ids])
 
-                # Add all test games to their collection (ensure for both new and existing users)
-                for game in test_games:
-                    # Check if collection exists
-                    stmt = select(Collection).where(
-                        Collection.user_id == user_id, Collection.game_id == game.id
+            existing_user_ids = set(
+                (
+                    await session.execute(
+                        select(User.telegram_id).where(User.telegram_id.in_(fake_user_ids))
                     )
-                    existing_col = (await session.execute(stmt)).scalar_one_or_none()
+                )
+                .scalars()
+                .all()
+            )
+            session.add_all(
+                [
+                    User(telegram_id=user_id, telegram_name=name)
+                    for user_id, name in fake_users
+                    if user_id not in existing_user_ids
+                ]
+            )
 
-                    if not existing_col:
-                        col = Collection(user_id=user_id, game_id=game.id)
-                        session.add(col)
+            # Add all test games to their collection (ensure for both new and existing users)
+            existing_cols_stmt = select(Collection.user_id, Collection.game_id).where(
+                Collection.user_id.in_(fake_user_ids),
+                Collection.game_id.in_(test_game_ids),
+            )
+            existing_cols = set((await session.execute(existing_cols_stmt)).all())
+            session.add_all(
+                [
+                    Collection(user_id=user_id, game_id=game_id)
+                    for user_id in fake_user_ids
+                    for game_id in test_game_ids
+                    if (user_id, game_id) not in existing_cols
+                ]
+            )
 
             # Delete any existing session completely to start fresh
             existing_session = await session.get(Session, chat_id)
@@ -1570,9 +1587,9 @@ async def test_mode(update: Update, context: ContextTypes.DEFAULT_TYPE):
             session.add(db_session)
 
             # Add fake users to the lobby
-            for user_id, _ in fake_users:
-                sp = SessionPlayer(session_id=chat_id, user_id=user_id)
-                session.add(sp)
+            session.add_all(
+                [SessionPlayer(session_id=chat_id, user_id=user_id) for user_id in fake_user_ids]
+            )
 
             # Also add the current user to the lobby
             calling_user_id = update.effective_user.id
@@ -2046,11 +2063,12 @@ async def start_poll_callback(update: Update, context: ContextTypes.DEFAULT_TYPE
         )
         return
 
-    # Check Poll Mode
-    session_obj = await session.get(Session, chat_id)
-    if session_obj and session_obj.poll_type == PollType.CUSTOM:
-        await create_custom_poll(update, context, session, list(valid_games), priority_game_ids)
-        return
+    # Check Poll Mode (fresh session: the one above is closed)
+    async with db.AsyncSessionLocal() as session:
+        session_obj = await session.get(Session, chat_id)
+        if session_obj and session_obj.poll_type == PollType.CUSTOM:
+            await create_custom_poll(update, context, session, list(valid_games), priority_game_ids)
+            return
 
     # Build poll description with context metadata
     poll_description = _build_poll_description(player_count, len(valid_games), session_obj)
@@ -3133,7 +3151,9 @@ async def custom_poll_vote_callback(update: Update, context: ContextTypes.DEFAUL
             valid_category_levels=valid_category_levels,
         )
 
-        # cast_vote commits internally; no extra commit needed here.
+        # cast_vote leaves the transaction open; commit before answering so the
+        # debounced re-render (own session) sees the vote.
+        await session.commit()
         with contextlib.suppress(telegram.error.BadRequest):
             await query.answer(result.message)
 
@@ -3578,7 +3598,9 @@ async def _handle_poll_category_vote(
             valid_category_levels=valid_category_levels,
         )
 
-        # cast_vote commits internally; no extra commit needed here.
+        # cast_vote leaves the transaction open; commit before answering so the
+        # debounced re-render (own session) sees the vote.
+        await session.commit()
         await query.answer(result.message)
 
         # Debounce the re-render (see custom_poll_vote_callback). Inline
@@ -3654,9 +3676,9 @@ async def _handle_poll_close(query, context: ContextTypes.DEFAULT_TYPE, poll_id:
         # Unpin the poll message
         await _try_unpin_message(context.bot, chat_id, game_poll.message_id)
 
-        # Delete the poll record (cascade deletes all PollVote rows)
+        # Delete the poll record along with its votes and added games.
         # The result message above remains visible in chat.
-        await session.delete(game_poll)
+        await PollService.delete_poll(session, poll_id)
 
         # End the game night session
         session_obj = await session.get(Session, chat_id)
@@ -8,9 +8,11 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from telegram.ext import (  # noqa: E402
+    Application,
     ApplicationBuilder,
     CallbackQueryHandler,
     CommandHandler,
+    ContextTypes,
     PollAnswerHandler,
 )
 
@@ -46,12 +48,33 @@ from src.bot.handlers import (  # noqa: E402
     toggle_shuffle_callback,
     toggle_weights_callback,
 )
+from src.core import db  # noqa: E402
 
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
 )
 logger = logging.getLogger(__name__)
 
+# How often to refresh SQLite planner statistics (PRAGMA optimize)
+DB_OPTIMIZE_INTERVAL_SECONDS = 6 * 60 * 60
+
+
+async def _optimize_db_job(context: ContextTypes.DEFAULT_TYPE) -> None:
+    try:
+        await db.optimize_sqlite()
+    except Exception as e:
+        logger.warning(f"PRAGMA optimize failed: {e}")
+
+
+async def _post_init(app: Application) -> None:
+    await db.check_sqlite_integrity()
+    if app.job_queue:
+        app.job_queue.run_repeating(
+            _optimize_db_job,
+            interval=DB_OPTIMIZE_INTERVAL_SECONDS,
+            first=DB_OPTIMIZE_INTERVAL_SECONDS,
+        )
+
 
 def main():
     token = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -62,7 +85,7 @@ def main():
     # concurrent_updates lets votes from different users process in parallel
     # instead of serializing one-update-at-a-time. Safe here because cast_vote
     # uses a row-level lock (Postgres) + IntegrityError handling for races.
-    app = ApplicationBuilder().token(token).concurrent_updates(True).build()
+    app = ApplicationBuilder().token(token).concurrent_updates(True).post_init(_post_init).build()
 
     # Handlers
     app.add_handler(CommandHandler("start", start))
@@ -3,6 +3,7 @@ import os
 from collections.abc import AsyncGenerator
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.core.models import Base
@@ -45,6 +46,56 @@ engine = create_async_engine(
     pool_size=10,  # Allow up to 10 concurrent connections
     max_overflow=20,  # Allow up to 20 additional connections if pool is full
 )
+
+# The dialect is fixed for the life of the process; hot paths (cast_vote's
+# row lock) read this instead of inspecting the session bind on every call.
+IS_POSTGRES = engine.dialect.name == "postgresql"
+
+# Applied to every pooled SQLite connection. The defaults (rollback journal,
+# synchronous=FULL, ~2MB cache) make each small vote/lobby write fsync and
+# block concurrent handlers on the writer lock; WAL + synchronous=NORMAL is
+# durable across app crashes and only risks the last commits on power loss.
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "cache_size=-65536",  # 64MB (negative = KiB)
+    "temp_store=MEMORY",
+    "mmap_size=268435456",  # 256MB
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+def _disable_driver_transactions(dbapi_connection, _connection_record) -> None:
+    dbapi_connection.isolation_level = None
+
+
+def _emit_begin(conn) -> None:
+    conn.exec_driver_sql("BEGIN")
+
+
+def enable_sqlite_savepoints(async_engine) -> None:
+    """
+    Let SQLAlchemy own SQLite transactions so SAVEPOINTs nest correctly.
+
+    pysqlite/aiosqlite only open a transaction before DML, so a SAVEPOINT
+    issued after plain SELECTs starts the transaction itself and its RELEASE
+    commits everything. Disabling the driver's handling and emitting BEGIN
+    ourselves is SQLAlchemy's documented workaround.
+    """
+    event.listen(async_engine.sync_engine, "connect", _disable_driver_transactions)
+    event.listen(async_engine.sync_engine, "begin", _emit_begin)
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    enable_sqlite_savepoints(engine)
+
 AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -64,6 +115,35 @@ async def init_db() -> None:
     logger.info("Database initialized with URL: %s", DATABASE_URL)
 
 
+async def check_sqlite_integrity() -> None:
+    """Log the result of PRAGMA integrity_check (no-op on non-SQLite backends)."""
+    if engine.dialect.name != "sqlite":
+        return
+    async with engine.connect() as conn:
+        result = (await conn.exec_driver_sql("PRAGMA integrity_check")).scalar()
+    if result == "ok":
+        logger.info("SQLite integrity check passed")
+    else:
+        logger.error("SQLite integrity check failed: %s", result)
+
+
+async def optimize_sqlite() -> None:
+    """
+    Refresh SQLite query-planner statistics with PRAGMA optimize.
+
+    Near-free on a healthy database; SQLite recommends running it every few
+    hours on long-lived connections so the planner keeps choosing the right
+    indexes. It only analyzes tables that queries on the same connection have
+    used, so this helps only when the pooled connection it gets has already
+    served queries; a fresh or idle one does nothing. Full statistics are
+    gathered by ANALYZE after migrations. No-op on non-SQLite backends.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("PRAGMA optimize")
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
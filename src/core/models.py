@@ -235,6 +235,8 @@ class PollVote(Base):
     # Ensure uniqueness of a specific vote
     # SQLite treats NULLs as distinct in unique constraints usually, but for our logic
     # a user voting for the SAME game/category should be blocked/toggled.
+    # Its (poll_id, user_id, vote_type, ...) index also serves cast_vote's per-user
+    # lookup as a covering index, so no separate composite index is declared.
     __table_args__ = (
         UniqueConstraint(
             "poll_id",
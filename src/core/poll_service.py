@@ -8,17 +8,22 @@ rules from Telegram-specific handling. This enables:
 - Reusable poll logic
 """
 
+import math
 import random
-from collections import namedtuple
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, bindparam, case, delete, func, or_, select, true
 from sqlalchemy.exc import IntegrityError
 
+from src.core.db import IS_POSTGRES
 from src.core.logic import calculate_poll_winner, group_games_by_complexity
 from src.core.models import (
     Collection,
+    GameNightPoll,
     GameState,
+    PollAddedGame,
     PollVote,
     Session,
     SessionPlayer,
@@ -26,8 +31,137 @@ from src.core.models import (
     VoteType,
 )
 
-# Named tuple for resolved votes (after category resolution)
-ResolvedVote = namedtuple("ResolvedVote", ["game_id", "user_id"])
+
+class ResolvedVote(NamedTuple):
+    """A vote after category resolution: always points at a concrete game."""
+
+    game_id: int
+    user_id: int
+
+
+@lru_cache(maxsize=256)
+def _calculate_effective_limit(vote_limit: int, game_count: int) -> int | None:
+    """
+    Calculate the effective vote limit for a session.
+
+    Memoized: cast_vote calls this on every vote with the same (limit, count)
+    pair for the life of a poll.
+
+    Args:
+        vote_limit: The configured vote limit (VoteLimit constant or int)
+        game_count: Number of games in the poll
+
+    Returns:
+        Effective limit as int, or None for unlimited
+    """
+    if vote_limit == VoteLimit.AUTO:
+        # max(3, ceil(log2(game_count)))
+        if game_count <= 0:
+            return 3
+        return max(3, math.ceil(math.log2(game_count)))
+    elif vote_limit == VoteLimit.UNLIMITED:
+        return None
+    else:
+        return vote_limit
+
+
+def _build_vote_state_stmt(vote_type: VoteType, filter_active: bool):
+    """
+    Build cast_vote's state query for one vote type.
+
+    Returns (existing_vote_id, active_vote_count) for a user in a poll: the id
+    of the vote matching :target_id (for toggle-off), and how many of the
+    user's votes count against the limit. With filter_active, votes for games
+    or levels outside :valid_game_ids / :valid_category_levels (suspended
+    votes) are excluded from the count so that a player-count change doesn't
+    silently block the user from voting for eligible games.
+    """
+    user_votes_stmt = select(
+        PollVote.id, PollVote.vote_type, PollVote.game_id, PollVote.category_level
+    ).where(
+        PollVote.poll_id == bindparam("poll_id"),
+        PollVote.user_id == bindparam("user_id"),
+    )
+
+    # Row-level lock for PostgreSQL to prevent concurrent toggle races.
+    # FOR UPDATE isn't allowed alongside aggregates, so the user's vote rows
+    # are locked in the subquery instead.
+    if IS_POSTGRES:
+        user_votes_stmt = user_votes_stmt.with_for_update()
+
+    uv = user_votes_stmt.subquery().c
+    target_col = uv.game_id if vote_type == VoteType.GAME else uv.category_level
+    is_match = and_(uv.vote_type == vote_type, target_col == bindparam("target_id"))
+
+    if filter_active:
+        is_active = or_(
+            and_(
+                uv.vote_type == VoteType.GAME,
+                uv.game_id.in_(bindparam("valid_game_ids", expanding=True)),
+            ),
+            and_(
+                uv.vote_type == VoteType.CATEGORY,
+                uv.category_level.in_(bindparam("valid_category_levels", expanding=True)),
+            ),
+        )
+    else:
+        is_active = true()
+
+    return select(
+        func.max(case((is_match, uv.id))),
+        func.coalesce(func.sum(case((is_active, 1), else_=0)), 0),
+    )
+
+
+# Built once so the per-vote hot path only binds parameters; SQLAlchemy's
+# compiled cache then serves the same construct on every call.
+_VOTE_STATE_STMTS = {
+    (vote_type, filter_active): _build_vote_state_stmt(vote_type, filter_active)
+    for vote_type in VoteType
+    for filter_active in (False, True)
+}
+
+
+def _resolve_category_votes(
+    all_votes: list,
+    valid_games: list,
+    groups: dict[int, list] | None = None,
+) -> list[ResolvedVote]:
+    """
+    Convert category votes to actual game votes.
+
+    Category votes are resolved to a random game from that
+    complexity category. Regular game votes are passed through unchanged.
+
+    Args:
+        all_votes: (vote_type, game_id, category_level, user_id) rows, as
+            returned by get_votes_for_poll
+        valid_games: List of Game objects in the poll
+        groups: Precomputed group_games_by_complexity(valid_games), if the
+            caller already has it
+
+    Returns:
+        List of ResolvedVote namedtuples with game_id and user_id
+    """
+    # Group games by complexity level
+    if groups is None:
+        groups = group_games_by_complexity(valid_games)
+
+    # Resolve each category to one random game (shared across all voters).
+    # Picked up front: at most one choice per complexity level, and levels
+    # with no games are simply absent.
+    category_resolutions = {level: random.choice(games) for level, games in groups.items() if games}
+
+    resolved_votes = []
+    for vote_type, game_id, category_level, user_id in all_votes:
+        if vote_type == VoteType.GAME:
+            resolved_votes.append(ResolvedVote(game_id, user_id))
+        elif vote_type == VoteType.CATEGORY:
+            game = category_resolutions.get(category_level)
+            if game is not None:
+                resolved_votes.append(ResolvedVote(game.id, user_id))
+
+    return resolved_votes
 
 
 @dataclass
@@ -50,29 +184,9 @@ class PollService:
     - Poll closing logic
     """
 
-    @staticmethod
-    def calculate_effective_limit(vote_limit: int, game_count: int) -> int | None:
-        """
-        Calculate the effective vote limit for a session.
-
-        Args:
-            vote_limit: The configured vote limit (VoteLimit constant or int)
-            game_count: Number of games in the poll
-
-        Returns:
-            Effective limit as int, or None for unlimited
-        """
-        if vote_limit == VoteLimit.AUTO:
-            # max(3, ceil(log2(game_count)))
-            import math
-
-            if game_count <= 0:
-                return 3
-            return max(3, math.ceil(math.log2(game_count)))
-        elif vote_limit == VoteLimit.UNLIMITED:
-            return None
-        else:
-            return vote_limit
+    # Pure helpers live at module scope; aliased here for the public API
+    calculate_effective_limit = staticmethod(_calculate_effective_limit)
+    resolve_category_votes = staticmethod(_resolve_category_votes)
 
     @staticmethod
     async def cast_vote(
@@ -92,6 +206,9 @@ class PollService:
         """
         Cast or toggle a vote with limit enforcement.
 
+        Does not commit: the vote is flushed (or deleted) inside the caller's
+        transaction, and the caller is responsible for committing it.
+
         Args:
             session: SQLAlchemy async session
             poll_id: The poll ID
@@ -105,69 +222,33 @@ class PollService:
         Returns:
             VoteResult with success status and message
         """
-        # Build query specific to vote type
-        stmt = select(PollVote).where(
-            PollVote.poll_id == poll_id,
-            PollVote.user_id == user_id,
-            PollVote.vote_type == vote_type,
-        )
-
-        if vote_type == VoteType.GAME:
-            stmt = stmt.where(PollVote.game_id == target_id)
-        else:
-            stmt = stmt.where(PollVote.category_level == target_id)
-
-        # Row-level lock for PostgreSQL to prevent concurrent toggle races.
-        # Uses sync_session.get_bind() since session.bind is deprecated in SQLAlchemy 2.x.
-        try:
-            bind = session.sync_session.get_bind()
-            if "postgresql" in bind.dialect.name:
-                stmt = stmt.with_for_update()
-        except Exception:
-            pass  # SQLite or unexpected — proceed without lock
-
-        existing_vote = (await session.execute(stmt)).scalar_one_or_none()
-
-        if existing_vote:
+        # A single round trip answers both questions cast_vote needs: does this
+        # exact vote already exist (toggle off), and how many *active* votes the
+        # user holds against the limit.
+        filter_active = valid_game_ids is not None and valid_category_levels is not None
+        state_stmt = _VOTE_STATE_STMTS[(vote_type, filter_active)]
+        params = {"poll_id": poll_id, "user_id": user_id, "target_id": target_id}
+        if filter_active:
+            params["valid_game_ids"] = list(valid_game_ids)
+            params["valid_category_levels"] = list(valid_category_levels)
+        existing_vote_id, user_vote_count = (await session.execute(state_stmt, params)).one()
+
+        if existing_vote_id is not None:
             # Toggle off - remove the vote
-            await session.delete(existing_vote)
-            await session.commit()
+            await session.execute(delete(PollVote).where(PollVote.id == existing_vote_id))
             return VoteResult(success=True, message="Vote removed", is_removal=True)
 
         # Check vote limit before adding
-        effective_limit = PollService.calculate_effective_limit(vote_limit, game_count)
-
-        if effective_limit is not None:
-            # Count only *active* votes against the limit — votes for games/levels
-            # that are currently invalid (suspended) are excluded so that a player-count
-            # change doesn't silently block the user from voting for eligible games.
-            user_votes_stmt = select(func.count(PollVote.id)).where(
-                PollVote.poll_id == poll_id,
-                PollVote.user_id == user_id,
+        effective_limit = _calculate_effective_limit(vote_limit, game_count)
+
+        if effective_limit is not None and user_vote_count >= effective_limit:
+            return VoteResult(
+                success=False,
+                message=(
+                    f"Vote limit reached ({user_vote_count}/{effective_limit}). "
+                    "Remove a vote first!"
+                ),
             )
-            if valid_game_ids is not None and valid_category_levels is not None:
-                user_votes_stmt = user_votes_stmt.where(
-                    or_(
-                        and_(
-                            PollVote.vote_type == VoteType.GAME,
-                            PollVote.game_id.in_(valid_game_ids),
-                        ),
-                        and_(
-                            PollVote.vote_type == VoteType.CATEGORY,
-                            PollVote.category_level.in_(valid_category_levels),
-                        ),
-                    )
-                )
-            user_vote_count = await session.scalar(user_votes_stmt) or 0
-
-            if user_vote_count >= effective_limit:
-                return VoteResult(
-                    success=False,
-                    message=(
-                        f"Vote limit reached ({user_vote_count}/{effective_limit}). "
-                        "Remove a vote first!"
-                    ),
-                )
 
         # Add new vote
         vote = PollVote(
@@ -184,12 +265,13 @@ class PollService:
         else:
             vote.category_level = target_id
 
+        # Savepoint so a lost race only undoes this insert, not the rest of the
+        # caller's transaction
         try:
-            session.add(vote)
-            await session.commit()
+            async with session.begin_nested():
+                session.add(vote)
         except IntegrityError:
             # Concurrent insert beat us — vote already exists, treat as success
-            await session.rollback()
             return VoteResult(success=True, message="Vote recorded")
 
         # Generate appropriate message
@@ -199,57 +281,34 @@ class PollService:
             return VoteResult(success=True, message="Vote recorded")
 
     @staticmethod
-    def resolve_category_votes(all_votes: list, valid_games: list) -> list[ResolvedVote]:
+    async def get_votes_for_poll(session, poll_id: str) -> list:
         """
-        Convert category votes to actual game votes.
+        Fetch all votes for a poll.
 
-        Category votes are resolved to a random game from that
-        complexity category. Regular game votes are passed through unchanged.
-
-        Args:
-            all_votes: List of PollVote records
-            valid_games: List of Game objects in the poll
-
-        Returns:
-            List of ResolvedVote namedtuples with game_id and user_id
+        Only the columns used for tallying are selected, so rows come back as
+        lightweight (vote_type, game_id, category_level, user_id) tuples
+        instead of hydrated PollVote objects.
         """
-        # Group games by complexity level
-        groups = group_games_by_complexity(valid_games)
-
-        # Resolve each category to one random game (shared across all voters)
-        category_resolutions = {}  # level -> selected game
-
-        for v in all_votes:
-            if v.vote_type == VoteType.CATEGORY:
-                level = v.category_level
-                if level not in category_resolutions:
-                    target_group = groups.get(level, [])
-                    if target_group:
-                        category_resolutions[level] = random.choice(target_group)
-
-        # Build resolved votes list
-        resolved_votes = []
-        for v in all_votes:
-            if v.vote_type == VoteType.CATEGORY:
-                level = v.category_level
-                if level in category_resolutions:
-                    resolved_votes.append(
-                        ResolvedVote(
-                            game_id=category_resolutions[level].id,
-                            user_id=v.user_id,
-                        )
-                    )
-            elif v.vote_type == VoteType.GAME:
-                resolved_votes.append(ResolvedVote(game_id=v.game_id, user_id=v.user_id))
-
-        return resolved_votes
+        stmt = select(
+            PollVote.vote_type,
+            PollVote.game_id,
+            PollVote.category_level,
+            PollVote.user_id,
+        ).where(PollVote.poll_id == poll_id)
+        return list((await session.execute(stmt)).all())
 
     @staticmethod
-    async def get_votes_for_poll(session, poll_id: str) -> list:
-        """Fetch all votes for a poll."""
-        stmt = select(PollVote).where(PollVote.poll_id == poll_id)
-        result = await session.execute(stmt)
-        return list(result.scalars().all())
+    async def delete_poll(session, poll_id: str) -> None:
+        """
+        Delete a poll together with its votes and user-added games.
+
+        Issues one bulk DELETE per table rather than relying on the ORM
+        cascade, which would load every child row and delete it individually.
+        Does not commit.
+        """
+        await session.execute(delete(PollVote).where(PollVote.poll_id == poll_id))
+        await session.execute(delete(PollAddedGame).where(PollAddedGame.poll_id == poll_id))
+        await session.execute(delete(GameNightPoll).where(GameNightPoll.poll_id == poll_id))
 
     @staticmethod
     async def build_star_collections(
@@ -260,15 +319,18 @@ class PollService:
 
         Used for weighted voting calculation.
         """
-        star_collections = {}
-        for g in valid_games:
-            if g.id in priority_ids:
-                stmt = select(Collection.user_id).where(
-                    Collection.game_id == g.id,
-                    Collection.state == GameState.STARRED,
-                )
-                starred_users = (await session.execute(stmt)).scalars().all()
-                star_collections[g.id] = list(starred_users)
+        priority_game_ids = [g.id for g in valid_games if g.id in priority_ids]
+        if not priority_game_ids:
+            return {}
+
+        # One IN query for all priority games instead of a round trip per game
+        stmt = select(Collection.game_id, Collection.user_id).where(
+            Collection.game_id.in_(priority_game_ids),
+            Collection.state == GameState.STARRED,
+        )
+        star_collections: dict[int, list[int]] = {gid: [] for gid in priority_game_ids}
+        for game_id, user_id in await session.execute(stmt):
+            star_collections[game_id].append(user_id)
         return star_collections
 
     @staticmethod
@@ -301,7 +363,8 @@ class PollService:
         all_votes = [v for v in all_votes if v.user_id in active_member_ids]
 
         # Resolve category votes to actual games
-        resolved_votes = PollService.resolve_category_votes(all_votes, valid_games)
+        groups = group_games_by_complexity(valid_games)
+        resolved_votes = _resolve_category_votes(all_votes, valid_games, groups)
 
         # Check if weighted voting is enabled
         session_obj = await session.get(Session, chat_id)
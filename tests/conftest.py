@@ -27,6 +27,8 @@ async def setup_test_db():
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    # Same transaction handling as the production SQLite engine
+    db.enable_sqlite_savepoints(test_engine)
 
     # Patch the global engine and sessionmaker in src.core.db
     # Since handlers.py imports 'db' and calls 'db.AsyncSessionLocal()', this works!
@@ -45,6 +45,7 @@ from src.core.models import (
     User,
     VoteType,
 )
+from src.core.poll_service import PollService
 
 # ============================================================================
 # Poll Settings Tests
@@ -620,6 +621,30 @@ async def test_custom_poll_close_resolves_category_votes(mock_update, mock_conte
     assert "tie" not in text.lower()
 
 
+def test_resolve_category_votes_preserves_order_and_skips_empty_levels():
+    """Game votes pass through in order; category votes share one pick per level;
+    votes for a level with no games are dropped."""
+    games = [
+        SimpleNamespace(id=1, name="Light", complexity=1.5),
+        SimpleNamespace(id=2, name="Heavy A", complexity=4.1),
+        SimpleNamespace(id=3, name="Heavy B", complexity=4.8),
+    ]
+    # (vote_type, game_id, category_level, user_id), as get_votes_for_poll returns
+    votes = [
+        (VoteType.CATEGORY, None, 4, 11),
+        (VoteType.GAME, 1, None, 22),
+        (VoteType.CATEGORY, None, 3, 33),
+        (VoteType.CATEGORY, None, 4, 44),
+    ]
+
+    resolved = PollService.resolve_category_votes(votes, games)
+
+    assert [r.user_id for r in resolved] == [11, 22, 44]
+    assert resolved[1].game_id == 1
+    assert resolved[0].game_id == resolved[2].game_id
+    assert resolved[0].game_id in {2, 3}
+
+
 @pytest.mark.asyncio
 async def test_custom_poll_close_no_votes(mock_update, mock_context):
     """Test closing poll with no votes shows appropriate message."""
@@ -2100,13 +2125,13 @@ async def test_poll_add_blocked_when_setting_disabled(mock_update, mock_context)
 
 
 # ============================================================================
-# Cascade Delete Test
+# Poll Close Cleanup Tests
 # ============================================================================
 
 
 @pytest.mark.asyncio
-async def test_poll_added_games_cascade_deleted(mock_update, mock_context):
-    """Test that PollAddedGame records are cascade-deleted when poll is closed."""
+async def test_poll_close_deletes_added_games_and_votes(mock_update, mock_context):
+    """Test that PollAddedGame and PollVote records are deleted when poll is closed."""
     chat_id = 12345
     poll_id = "poll_12345_cascade"
 
@@ -2149,6 +2174,7 @@ async def test_poll_added_games_cascade_deleted(mock_update, mock_context):
 
         added = PollAddedGame(poll_id=poll_id, game_id=99, added_by_user_id=111)
         session.add(added)
+        session.add(PollVote(poll_id=poll_id, user_id=111, vote_type=VoteType.GAME, game_id=1))
         await session.commit()
 
     mock_update.callback_query.data = f"poll_close:{poll_id}"
@@ -2157,7 +2183,7 @@ async def test_poll_added_games_cascade_deleted(mock_update, mock_context):
 
     await custom_poll_action_callback(mock_update, mock_context)
 
-    # Verify both poll and added games are gone
+    # Verify poll, added games and votes are gone
     async with db.AsyncSessionLocal() as session:
         poll = await session.get(GameNightPoll, poll_id)
         assert poll is None
@@ -2166,6 +2192,70 @@ async def test_poll_added_games_cascade_deleted(mock_update, mock_context):
         added = (await session.execute(stmt)).scalars().all()
         assert len(added) == 0
 
+        stmt = select(PollVote).where(PollVote.poll_id == poll_id)
+        assert (await session.execute(stmt)).scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_close_existing_polls_deletes_added_games_and_votes(mock_context):
+    """Test that _close_existing_polls removes every poll's votes and added games."""
+    chat_id = 12345
+    poll_ids = ["poll_12345_old_a", "poll_12345_old_b"]
+
+    async with db.AsyncSessionLocal() as session:
+        session.add(Session(chat_id=chat_id, is_active=True, poll_type=PollType.CUSTOM))
+        session.add_all(
+            [
+                Game(
+                    id=1,
+                    name="Game1",
+                    min_players=2,
+                    max_players=4,
+                    playing_time=60,
+                    complexity=2.0,
+                ),
+                Game(
+                    id=99,
+                    name="Added",
+                    min_players=2,
+                    max_players=4,
+                    playing_time=60,
+                    complexity=1.5,
+                ),
+            ]
+        )
+        await session.commit()
+
+        for i, poll_id in enumerate(poll_ids):
+            session.add(GameNightPoll(poll_id=poll_id, chat_id=chat_id, message_id=900 + i))
+            session.add(PollAddedGame(poll_id=poll_id, game_id=99, added_by_user_id=111))
+            session.add(PollVote(poll_id=poll_id, user_id=111, vote_type=VoteType.GAME, game_id=1))
+            session.add(
+                PollVote(
+                    poll_id=poll_id, user_id=222, vote_type=VoteType.CATEGORY, category_level=2
+                )
+            )
+        await session.commit()
+
+    mock_context.bot.stop_poll = AsyncMock()
+    mock_context.bot.unpin_chat_message = AsyncMock()
+
+    async with db.AsyncSessionLocal() as session:
+        await handlers._close_existing_polls(session, mock_context, chat_id)
+        await session.commit()
+
+    assert mock_context.bot.stop_poll.await_count == len(poll_ids)
+
+    async with db.AsyncSessionLocal() as session:
+        stmt = select(GameNightPoll).where(GameNightPoll.chat_id == chat_id)
+        assert (await session.execute(stmt)).scalars().all() == []
+
+        stmt = select(PollAddedGame).where(PollAddedGame.poll_id.in_(poll_ids))
+        assert (await session.execute(stmt)).scalars().all() == []
+
+        stmt = select(PollVote).where(PollVote.poll_id.in_(poll_ids))
+        assert (await session.execute(stmt)).scalars().all() == []
+
 
 # ============================================================================
 # Button Label Wrapping Tests
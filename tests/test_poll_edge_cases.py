@@ -1,12 +1,12 @@
 import pytest
-from sqlalchemy import select
+from sqlalchemy import literal, select, text
 
 from src.bot.handlers import (
     cancel_night_callback,
     custom_poll_vote_callback,
     render_poll_message,
 )
-from src.core import db
+from src.core import db, poll_service
 from src.core.models import (
     Collection,
     Game,
@@ -16,8 +16,10 @@ from src.core.models import (
     Session,
     SessionPlayer,
     User,
+    VoteLimit,
     VoteType,
 )
+from src.core.poll_service import PollService
 
 # Note: mock_update and mock_context fixtures are inherited from conftest.py
 
@@ -194,3 +196,118 @@ async def test_render_anonymous_poll(mock_update, mock_context):
     assert "SecretGame" in text
     assert "SecretVoter" not in text
     assert "1 voters" in text  # Count should be visible in text
+
+
+@pytest.mark.asyncio
+async def test_cast_vote_leaves_commit_to_caller():
+    """cast_vote only flushes; the vote persists once the caller commits."""
+    poll_id = "poll_commit_contract"
+    async with db.AsyncSessionLocal() as session:
+        session.add(Session(chat_id=1, is_active=True))
+        session.add(
+            Game(id=1, name="G", min_players=1, max_players=4, complexity=2.0, playing_time=30)
+        )
+        await session.commit()
+
+        session.add(GameNightPoll(poll_id=poll_id, chat_id=1, message_id=1))
+        await session.commit()
+
+    vote_kwargs = {
+        "poll_id": poll_id,
+        "user_id": 111,
+        "target_id": 1,
+        "vote_type": VoteType.GAME,
+        "user_name": "Voter",
+        "vote_limit": VoteLimit.UNLIMITED,
+        "game_count": 1,
+    }
+    votes_stmt = select(PollVote).where(PollVote.poll_id == poll_id)
+
+    # Not committed by the caller -> discarded with the session
+    async with db.AsyncSessionLocal() as session:
+        result = await PollService.cast_vote(session=session, **vote_kwargs)
+        assert result.success
+    async with db.AsyncSessionLocal() as session:
+        assert (await session.execute(votes_stmt)).scalars().all() == []
+
+    async with db.AsyncSessionLocal() as session:
+        await PollService.cast_vote(session=session, **vote_kwargs)
+        await session.commit()
+    async with db.AsyncSessionLocal() as session:
+        assert len((await session.execute(votes_stmt)).scalars().all()) == 1
+
+    # Toggle-off follows the same contract
+    async with db.AsyncSessionLocal() as session:
+        result = await PollService.cast_vote(session=session, **vote_kwargs)
+        assert result.is_removal
+        await session.commit()
+    async with db.AsyncSessionLocal() as session:
+        assert (await session.execute(votes_stmt)).scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_cast_vote_duplicate_keeps_callers_earlier_work(monkeypatch):
+    """A lost insert race only undoes the duplicate, not the caller's transaction."""
+    poll_id = "poll_duplicate_race"
+    async with db.AsyncSessionLocal() as session:
+        session.add(Session(chat_id=1, is_active=True))
+        session.add_all(
+            [
+                Game(
+                    id=gid,
+                    name=f"G{gid}",
+                    min_players=1,
+                    max_players=4,
+                    complexity=2.0,
+                    playing_time=30,
+                )
+                for gid in (1, 2)
+            ]
+        )
+        await session.commit()
+
+        session.add(GameNightPoll(poll_id=poll_id, chat_id=1, message_id=1))
+        session.add(PollVote(poll_id=poll_id, user_id=111, vote_type=VoteType.GAME, game_id=1))
+        await session.commit()
+
+        # uq_poll_vote can't reject this duplicate on its own: its unused
+        # game_id/category_level column is NULL, and NULLs compare distinct.
+        # A NULL-safe index stands in for the racing insert's conflict.
+        await session.execute(
+            text(
+                "CREATE UNIQUE INDEX ux_test_poll_vote ON poll_votes "
+                "(poll_id, user_id, vote_type, "
+                "COALESCE(game_id, -1), COALESCE(category_level, -1))"
+            )
+        )
+        await session.commit()
+
+    vote_kwargs = {
+        "poll_id": poll_id,
+        "user_id": 111,
+        "vote_type": VoteType.GAME,
+        "user_name": "Voter",
+        "vote_limit": VoteLimit.UNLIMITED,
+        "game_count": 2,
+    }
+
+    async with db.AsyncSessionLocal() as session:
+        # Earlier vote in the same caller transaction
+        result = await PollService.cast_vote(session=session, target_id=2, **vote_kwargs)
+        assert result.success and not result.is_removal
+
+        # Simulate losing the race: the state query doesn't see the existing
+        # vote for game 1, so the insert hits uq_poll_vote.
+        monkeypatch.setitem(
+            poll_service._VOTE_STATE_STMTS,
+            (VoteType.GAME, False),
+            select(literal(None), literal(0)),
+        )
+        result = await PollService.cast_vote(session=session, target_id=1, **vote_kwargs)
+        assert result.success and result.message == "Vote recorded"
+
+        await session.commit()
+
+    async with db.AsyncSessionLocal() as session:
+        stmt = select(PollVote.game_id).where(PollVote.poll_id == poll_id)
+        assert sorted((await session.execute(stmt)).scalars().all()) == [1, 2]
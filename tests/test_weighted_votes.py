@@ -13,6 +13,7 @@ from src.core.models import (
     SessionPlayer,
     User,
 )
+from src.core.poll_service import PollService
 
 
 @pytest.mark.asyncio
@@ -222,3 +223,35 @@ async def test_per_user_star_boost(mock_update, mock_context):
     assert "Triple Star" in text
     assert "Normal Game" not in text
     assert "winner" in text.lower()
+
+
+@pytest.mark.asyncio
+async def test_build_star_collections_groups_starrers_per_game():
+    """Starred users are bucketed per priority game; unstarred priority games map to []."""
+    async with db.AsyncSessionLocal() as session:
+        session.add_all([User(telegram_id=uid, telegram_name=f"U{uid}") for uid in (1, 2, 3)])
+        games = [
+            Game(
+                id=gid, name=f"G{gid}", min_players=1, max_players=4, playing_time=30, complexity=2
+            )
+            for gid in (10, 20, 30)
+        ]
+        session.add_all(games)
+        session.add_all(
+            [
+                Collection(user_id=1, game_id=10, state=GameState.STARRED),
+                Collection(user_id=2, game_id=10, state=GameState.STARRED),
+                Collection(user_id=3, game_id=10, state=GameState.INCLUDED),
+                Collection(user_id=3, game_id=20, state=GameState.EXCLUDED),
+                Collection(user_id=1, game_id=30, state=GameState.STARRED),
+            ]
+        )
+        await session.commit()
+
+        result = await PollService.build_star_collections(session, games, {10, 20})
+
+        assert set(result) == {10, 20}  # game 30 is not a priority game
+        assert sorted(result[10]) == [1, 2]
+        assert result[20] == []
+
+        assert await PollService.build_star_collections(session, games, set()) == {}